@@ -1,16 +1,191 @@
-# This is a sample Python script.
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
 
-# Press ⌃R to execute it or replace it with your code.
-# Press Double ⇧ to search everywhere for classes, files, tool windows, actions, and settings.
+"""
+Command line entry point of the link checker.
 
+Only the standard library is imported at startup; each command imports what it needs, so
+'validate' and 'report' run without Selenium, webdriver_manager or BeautifulSoup.
+"""
 
-def print_hi(name):
-    # Use a breakpoint in the code line below to debug your script.
-    print(f'Hi, {name}')  # Press ⌘F8 to toggle the breakpoint.
+import argparse
+import logging
+import signal
+import sys
 
+from util.util_base import ENVIRONMENTS, get_env_config
 
-# Press the green button in the gutter to run the script.
-if __name__ == '__main__':
-    print_hi('PyCharm')
 
-# See PyCharm help at https://www.jetbrains.com/help/pycharm/
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="OBI link checker")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    browser_options = argparse.ArgumentParser(add_help=False)
+    browser_options.add_argument("--env", default="staging", choices=list(ENVIRONMENTS),
+                                 help="Choose environment: staging, production")
+    browser_options.add_argument("--browser-name", default="chrome", help="Choose browser: chrome, firefox")
+    browser_options.add_argument("--headless", action="store_true", help="Run the browser in headless mode")
+
+    replay_options = argparse.ArgumentParser(add_help=False)
+    recording = replay_options.add_mutually_exclusive_group()
+    recording.add_argument("--record", metavar="FILE", help="Record HTTP responses and page snapshots to FILE")
+    recording.add_argument("--replay", metavar="FILE", help="Replay HTTP responses and page snapshots from FILE")
+
+    harvest = subparsers.add_parser("harvest", parents=[browser_options, replay_options],
+                                    help="Log in, collect the links of every page and save them")
+    harvest.add_argument("--output", default="harvest.json", help="Harvest file to write")
+
+    validate = subparsers.add_parser("validate", parents=[replay_options], help="Check the links of a harvest file or a URL list")
+    validate.add_argument("file", help="Harvest JSON file, or a text file with one URL per line")
+    validate.add_argument("--env", default="staging", choices=list(ENVIRONMENTS),
+                          help="Environment used as Referer when the file doesn't name one: staging, production")
+    validate.add_argument("--workers", type=int, default=8, help="Number of concurrent validation workers")
+    validate.add_argument("--output", default="results.json", help="Results file to write")
+    threshold = validate.add_mutually_exclusive_group()
+    threshold.add_argument("--fail-fast", action="store_const", const=1, dest="max_broken",
+                           help="Stop at the first broken link")
+    threshold.add_argument("--max-broken", type=int, help="Stop once this many broken links are found")
+
+    report = subparsers.add_parser("report", help="Print the summary and broken links of a results file")
+    report.add_argument("results", nargs="?", default="results.json", help="Results file written by 'validate'")
+
+    multi_env = subparsers.add_parser("multi-env", help="Harvest several environments and check shared links once")
+    multi_env.add_argument("--envs", nargs="+", default=list(ENVIRONMENTS), choices=list(ENVIRONMENTS),
+                           help="Environments to check (default: all)")
+    multi_env.add_argument("--browser-name", default="chrome", help="Choose browser: chrome, firefox")
+    multi_env.add_argument("--headless", action="store_true", help="Run the browser in headless mode")
+    multi_env.add_argument("--workers", type=int, default=8, help="Number of concurrent validation workers")
+
+    watch = subparsers.add_parser("watch", parents=[browser_options],
+                                  help="Keep a logged-in browser open and re-check links on a schedule")
+    watch.add_argument("--interval", type=int, default=900, help="Seconds between two check cycles")
+    watch.add_argument("--jitter", type=int, default=60, help="Random +/- seconds added to each interval")
+    watch.add_argument("--harvest-every", type=int, default=1, help="Re-harvest the pages every N cycles")
+    watch.add_argument("--host", default="127.0.0.1", help="Status endpoint host")
+    watch.add_argument("--port", type=int, default=8765, help="Status endpoint port")
+    return parser.parse_args(argv)
+
+
+def open_recording(args):
+    """Returns the Recording named by --record or --replay, or None."""
+    if not (args.record or args.replay):
+        return None
+    from util.replay import Recording
+
+    return Recording(args.replay or args.record)
+
+
+def run_harvest(args, logger):
+    from pages.urls import get_page_groups
+    from util.link_checker import LinkChecker
+    from util.link_files import save_harvest
+
+    recording = open_recording(args)
+    all_links, link_sources = {}, {}
+
+    if args.replay:
+        base_url = ENVIRONMENTS[args.env]["base_url"]
+        checker = LinkChecker(base_url, recording=recording, replay=True)
+        for group, label in get_page_groups(list(recording.pages)):
+            checker.collect_links_from_pages(group, label, None, None, all_links, link_sources)
+    else:
+        from pages.home_page import HomePage
+        from util.browser import create_browser, login
+
+        config = get_env_config(args.env)
+        base_url = config["base_url"]
+        browser, wait = create_browser(args.browser_name, args.headless)
+        try:
+            login(browser, wait, config, logger)
+            home_page = HomePage(browser, wait, base_url, logger)
+            checker = LinkChecker(base_url, recording=recording)
+
+            pages = home_page.get_pages(config["lab_id"], config["project_id"])
+            for group, label in get_page_groups(pages):
+                checker.collect_links_from_pages(group, label, browser, home_page, all_links, link_sources)
+        finally:
+            browser.quit()
+
+    save_harvest(args.output, base_url, all_links, link_sources, checker.page_anchors)
+    logger.info(f"✅ Saved {len(link_sources)} links to {args.output}")
+    return 0
+
+
+def run_validate(args, logger):
+    from util.link_checker import LinkChecker
+    from util.link_files import load_links, save_results
+
+    base_url, all_links, link_sources, page_anchors = load_links(args.file)
+    checker = LinkChecker(base_url or ENVIRONMENTS[args.env]["base_url"], workers=args.workers,
+                          recording=open_recording(args), replay=bool(args.replay), max_broken=args.max_broken)
+    checker.page_anchors = page_anchors
+
+    summary = checker.validate_links(all_links, link_sources)
+    save_results(args.output, summary)
+    logger.info(f"✅ Saved the results to {args.output}")
+    return 1 if summary["broken"] else 0
+
+
+def run_report(args, logger):
+    from util.link_files import load_results
+
+    summary = load_results(args.results)
+    broken = {link: result for link, result in summary["links"].items() if result["status"] >= 400}
+
+    print("\n📊 Link Report:")
+    print(f"🔗 Total links: {summary['total']}")
+    print(f"✅ Valid: {summary['valid']}")
+    print(f"❌ Broken: {summary['broken']}")
+    for link, result in sorted(broken.items(), key=lambda item: item[1]["page"]):
+        print(f"{result['label']} {link} → Status {result['status']} | Page: {result['page']}")
+    return 1 if broken else 0
+
+
+def run_multi_env(args, logger):
+    from util.multi_env import check_environments
+
+    summaries = check_environments(args.envs, logger, browser_name=args.browser_name, headless=args.headless,
+                                   workers=args.workers)
+    return 1 if any(summary["broken"] for summary in summaries.values()) else 0
+
+
+def run_watch(args, logger):
+    from util.daemon import LinkCheckDaemon
+
+    daemon = LinkCheckDaemon(
+        get_env_config(args.env), logger,
+        browser_name=args.browser_name, headless=args.headless,
+        interval=args.interval, jitter=args.jitter, harvest_every=args.harvest_every,
+        host=args.host, port=args.port,
+    )
+
+    def stop(signum, frame):
+        logger.info(f"🛑 Received {signal.Signals(signum).name}, stopping watch mode after the current check.")
+        daemon.stop()
+
+    # systemd and docker stop send SIGTERM; stopping through the daemon lets it quit the browser.
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    daemon.start()
+    logger.info("🛑 Watch mode stopped.")
+    return 0
+
+
+COMMANDS = {
+    "harvest": run_harvest,
+    "validate": run_validate,
+    "report": run_report,
+    "multi-env": run_multi_env,
+    "watch": run_watch,
+}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s : %(asctime)s : %(message)s")
+    return COMMANDS[args.command](args, logging.getLogger("link_checker"))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,90 @@ from selenium.common import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+# Collects the row keys not seen yet on this page from every ant-design table and
+# advances each table by one step: scroll a virtual body until its bottom, then go to the
+# next page. Plain bodies already hold every row of their page, so they are never scrolled.
+# A loading table is left alone, one that produced no new rows is given arguments[1] steps
+# to finish rendering before it is advanced anyway, and one with nothing left is marked as done.
+TABLE_ROW_KEYS_SCRIPT = """
+if (arguments[0] || !window.__obiRowKeys) { window.__obiRowKeys = new Set(); }
+const seen = window.__obiRowKeys;
+const idleSteps = arguments[1];
+const fresh = [];
+let pending = false;
+let moved = false;
+document.querySelectorAll('.ant-table-wrapper').forEach((table) => {
+    let found = 0;
+    table.querySelectorAll('tr[data-row-key]').forEach((row) => {
+        const key = row.getAttribute('data-row-key');
+        if (key && !seen.has(key)) {
+            seen.add(key);
+            fresh.push(key);
+            found += 1;
+        }
+    });
+    if (table.__obiDone) { return; }
+    pending = true;
+    if (table.querySelector('.ant-spin-spinning')) { return; }
+    table.__obiIdle = found ? 0 : (table.__obiIdle || 0) + 1;
+    if (table.__obiIdle && table.__obiIdle < idleSteps) { return; }
+    table.__obiIdle = 0;
+    moved = true;
+    const body = table.querySelector('.ant-table-tbody-virtual-holder');
+    if (body && body.scrollTop + body.clientHeight < body.scrollHeight - 1) {
+        body.scrollTop += body.clientHeight;
+        return;
+    }
+    const next = table.querySelector('.ant-pagination-next:not(.ant-pagination-disabled)');
+    if (next) {
+        (next.querySelector('button') || next).click();
+        return;
+    }
+    table.__obiDone = true;
+});
+return {keys: fresh, pending: pending, moved: moved};
+"""
+
+# Collects the ids and legacy <a name> values that in-page fragments (#section) can point to.
+ANCHOR_TARGETS_SCRIPT = """
+const targets = [];
+document.querySelectorAll('[id], a[name]').forEach((el) => {
+    if (el.id) { targets.push(el.id); }
+    if (el.tagName === 'A' && el.getAttribute('name')) { targets.push(el.getAttribute('name')); }
+});
+return targets;
+"""
+
+# Hashes the sorted list of link targets (anchors, table row keys, onclick buttons) and element ids
+# of the page, so an unchanged page can be recognised without transferring or parsing its source.
+# Returns null when a table is still loading, empty, paged or scrolling: its rendered rows aren't
+# the complete row set, so the hash wouldn't change when entities are added or removed.
+PAGE_FINGERPRINT_SCRIPT = """
+for (const table of document.querySelectorAll('.ant-table-wrapper')) {
+    const body = table.querySelector('.ant-table-tbody-virtual-holder, .ant-table-body');
+    if (table.querySelector('.ant-spin-spinning, .ant-pagination-next:not(.ant-pagination-disabled)')
+        || !table.querySelector('tr[data-row-key]')
+        || (body && body.scrollHeight > body.clientHeight + 1)) {
+        return null;
+    }
+}
+const parts = [];
+document.querySelectorAll('a[href]').forEach((a) => parts.push('a:' + a.href));
+document.querySelectorAll('tr[data-row-key]').forEach((row) => parts.push('r:' + row.getAttribute('data-row-key')));
+document.querySelectorAll('button[onclick]').forEach((btn) => parts.push('b:' + btn.getAttribute('onclick')));
+document.querySelectorAll('[id]').forEach((el) => parts.push('#' + el.id));
+const text = parts.sort().join('\\n');
+let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+for (let i = 0; i < text.length; i++) {
+    const c = text.charCodeAt(i);
+    h1 = Math.imul(h1 ^ c, 2654435761);
+    h2 = Math.imul(h2 ^ c, 1597334677);
+}
+h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+return parts.length + ':' + (h2 >>> 0).toString(16) + (h1 >>> 0).toString(16);
+"""
+
 @pytest.mark.usefixtures("setup", "logger")
 class CustomBasePage:
 
@@ -85,11 +169,89 @@ class CustomBasePage:
         except TimeoutException as e:
             raise RuntimeError(message or f"Condition not met within {timeout} seconds") from e
 
-    def get_all_links(self):
-        """Returns all valid absolute links from the page, handling relative URLs and hidden links."""
+    def harvest_table_rows(self, link_store, max_rows=5000, max_steps=200, idle_steps=5, table_idle_steps=3,
+                           pause=0.3):
+        """
+        Scrolls or pages through every ant-design table on the page and adds the row keys to link_store.
+
+        Virtualized and paginated tables only keep a window of rows in the DOM, so each step runs
+        one script that returns the keys that appeared since the previous step and moves the tables on.
+        Harvesting stops once every table is exhausted, no table produced new keys or moved on for
+        idle_steps steps, or max_rows keys / max_steps steps are reached.
+
+        :param link_store: Set-like object receiving the absolute row links as they are found.
+        :param max_rows: Maximum number of row keys to collect from the page.
+        :param max_steps: Maximum number of scroll/paging steps.
+        :param idle_steps: Number of consecutive steps without new keys or table moves before giving up.
+        :param table_idle_steps: Number of steps without new keys a table gets to render before it is
+                                 scrolled or paged anyway; keep it below idle_steps.
+        :param pause: Seconds to let the table render after each step.
+        :return: The number of row keys harvested.
+        """
+        harvested = idle = 0
+
+        for step in range(max_steps):
+            batch = self.browser.execute_script(TABLE_ROW_KEYS_SCRIPT, step == 0, table_idle_steps) or {}
+            keys = batch.get("keys") or []
+
+            for row_link in keys[:max_rows - harvested]:
+                full_url = urljoin(self.base_url, row_link) if not row_link.startswith("http") else row_link
+                link_store.add(full_url)
+            harvested = min(harvested + len(keys), max_rows)
+
+            if harvested >= max_rows:
+                self.logger.warning(f"⚠️ Row cap of {max_rows} reached, stopping table harvesting.")
+                break
+            idle = 0 if keys or batch.get("moved") else idle + 1
+            if not batch.get("pending") or idle >= idle_steps:
+                break
+            time.sleep(pause)
+
+        if harvested:
+            self.logger.info(f"📋 Harvested {harvested} table rows.")
+        return harvested
+
+    def get_page_fingerprint(self):
+        """
+        Returns a hash of the page's link targets and ids.
+
+        Call it once the page is rendered (see wait_for_links). Returns None if it can't be computed,
+        or if a table doesn't show all of its rows at once, so such pages are always harvested again.
+        """
+        try:
+            return self.browser.execute_script(PAGE_FINGERPRINT_SCRIPT)
+        except Exception as e:
+            self.logger.error(f"❌ Error computing page fingerprint: {str(e)}")
+            return None
+
+    def get_anchor_targets(self):
+        """Returns the set of fragment targets on the current page, or None if they can't be read."""
+        try:
+            return set(self.browser.execute_script(ANCHOR_TARGETS_SCRIPT) or [])
+        except Exception as e:
+            self.logger.error(f"❌ Error reading anchor targets: {str(e)}")
+            return None
+
+    def wait_for_links(self):
+        """Waits for the page's links to render. Returns False if no link showed up in time."""
         try:
             self.wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "a")))
-            time.sleep(2)  # Allow additional time for dynamically loaded elements
+        except TimeoutException:
+            self.logger.warning("⚠️ No links rendered on the page in time.")
+            return False
+        time.sleep(2)  # Allow additional time for dynamically loaded elements
+        return True
+
+    def get_all_links(self, wait=True):
+        """
+        Returns all valid absolute links from the page, handling relative URLs and hidden links.
+
+        :param wait: Wait for the links to render first; pass False if wait_for_links was already called.
+        """
+        try:
+            if wait:
+                self.wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "a")))
+                time.sleep(2)  # Allow additional time for dynamically loaded elements
 
             links = set()
 
@@ -100,12 +262,7 @@ class CustomBasePage:
                     full_url = urljoin(self.base_url, href) if not href.startswith("http") else href
                     links.add(full_url)
 
-            row_elements = self.browser.find_elements(By.XPATH, "//tr[@data-row-key]")
-            for row in row_elements:
-                row_link = row.get_attribute("data-row-key")
-                if row_link:
-                    full_url = urljoin(self.base_url, row_link) if not row_link.startswith("http") else row_link
-                    links.add(full_url)
+            self.harvest_table_rows(links)
 
             button_elements = self.browser.find_elements(By.TAG_NAME, "button")
             for btn in button_elements:
@@ -45,3 +45,9 @@ def get_dynamic_pages(base_url, lab_id, project_id):
         f"{base_url}/app/virtual-lab/lab/{lab_id}/project/{project_id}/simulate",
     ]
 
+
+def get_page_groups(pages):
+    """Splits the pages into the public landing pages and the authenticated platform pages."""
+    landing_pages = [page for page in pages if "/app/virtual-lab" not in page]
+    platform_pages = [page for page in pages if "/app/virtual-lab" in page]
+    return [(landing_pages, "LANDING"), (platform_pages, "AUTHENTICATED")]
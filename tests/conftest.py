@@ -8,18 +8,13 @@ import sys
 import time
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.support import expected_conditions as EC
 
 from pages.landing_page import LandingPage
 from pages.login_page import LoginPage
+from util.browser import create_browser
+from util.util_base import get_env_config
 
 
 def pytest_addoption(parser):
@@ -28,38 +23,15 @@ def pytest_addoption(parser):
     parser.addoption("--browser-name", action="store", default="chrome", help="Choose browser: chrome, firefox, safari")
     parser.addoption("--env", action="store", default="staging", help="Choose environment: staging, production")
     parser.addoption("--env_url", action="store", help="Base URL of the environment")
+    parser.addoption("--fail-fast", action="store_const", const=1, dest="max_broken",
+                     help="Stop checking links at the first broken one")
+    parser.addoption("--max-broken", action="store", type=int, dest="max_broken",
+                     help="Stop checking links once this many are broken")
 
 @pytest.fixture(scope="session")
 def test_config(pytestconfig):
     """Gets credentials and IDS returns the correct environment-specific settings."""
-    username = os.getenv("OBI_USERNAME")
-    password = os.getenv("OBI_PASSWORD")
-    env = pytestconfig.getoption("env")
-
-    if not username or not password:
-        raise ValueError("Username or password is missing in the configuration!")
-
-    if env =="staging":
-        base_url = "https://staging.openbraininstitute.org"
-        lab_url = f"{base_url}/app/virtual-lab"
-        lab_id = os.getenv("LAB_ID_STAGING")
-        project_id = os.getenv("PROJECT_ID_STAGING")
-    elif env == "production":
-        base_url = "https://www.openbraininstitute.org"
-        lab_url = f"{base_url}/app/virtual-lab"
-        lab_id = os.getenv("LAB_ID_PRODUCTION")
-        project_id = os.getenv("PROJECT_ID_PRODUCTION")
-    else:
-        raise ValueError(f"Invalid environment: {env}")
-
-    return {
-        "username": username,
-        "password": password,
-        "base_url": base_url,
-        "lab_url": lab_url,
-        "lab_id": lab_id,
-        "project_id": project_id,
-    }
+    return get_env_config(pytestconfig.getoption("env"))
 
 @pytest.fixture(scope="class", autouse=True)
 def setup(request, pytestconfig, test_config):
@@ -72,22 +44,7 @@ def setup(request, pytestconfig, test_config):
 
     print(f"Starting tests in {environment.upper()} mode.")
 
-    if browser_name == "chrome":
-        options = ChromeOptions()
-        if pytestconfig.getoption("--headless"):
-            options.add_argument("--headless")
-            options.add_argument("--ignore-certificate-errors")
-        browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-    elif browser_name == "firefox":
-        options = FirefoxOptions()
-        if pytestconfig.getoption("--headless"):
-            options.add_argument("--headless")
-        browser = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
-    else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
-
-    browser.set_page_load_timeout(60)
-    wait = WebDriverWait(browser, 20)
+    browser, wait = create_browser(browser_name, pytestconfig.getoption("--headless"))
 
     request.cls.base_url = base_url
     request.cls.lab_id = lab_id
@@ -0,0 +1,139 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import threading
+
+import pytest
+
+from util.link_checker import LinkChecker
+from util.link_history import LinkHistory
+from util.page_cache import PageCache
+from util.redirects import RedirectCache
+
+BASE_URL = "https://x.org"
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+
+class FakeSession:
+    """Answers GET requests from a {url: status} map, unknown URLs are 404."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.headers = {}
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.routes.get(url, 404))
+
+
+class SignallingSession(FakeSession):
+    """Sets an event once a request was answered."""
+
+    def __init__(self, routes, answered):
+        super().__init__(routes)
+        self.answered = answered
+
+    def get(self, url, **kwargs):
+        response = super().get(url, **kwargs)
+        self.answered.set()
+        return response
+
+
+class FakeBrowser:
+    current_url = None
+    page_source = "<html><body></body></html>"
+
+    def get(self, url):
+        self.current_url = url
+
+    def find_element(self, by, value):
+        return object()
+
+
+class FakeHomePage:
+    """Serves one broken link per page; the second page waits until the first one's link was checked."""
+
+    def __init__(self, browser, checked):
+        self.browser = browser
+        self.checked = checked
+
+    def wait_for_links(self):
+        return True
+
+    def get_page_fingerprint(self):
+        return f"fingerprint of {self.browser.current_url}"
+
+    def get_all_links(self, wait=True):
+        if self.browser.current_url.endswith("/second"):
+            self.checked.wait(5)
+        return [f"{self.browser.current_url}/gone"]
+
+    def get_anchor_targets(self):
+        return set()
+
+
+@pytest.fixture(autouse=True)
+def setup(monkeypatch):
+    """Replaces the browser session fixture and skips the page load pauses."""
+    monkeypatch.setattr("util.link_checker.time.sleep", lambda seconds: None)
+    yield
+
+
+def validate(links, history, max_broken, tmp_path):
+    checker = LinkChecker(BASE_URL, session=FakeSession({f"{BASE_URL}/ok": 200}), workers=1,
+                          redirect_cache=RedirectCache(None), page_cache=PageCache(None), history=history,
+                          max_broken=max_broken)
+    return checker.validate_links(dict.fromkeys(links), dict.fromkeys(links, BASE_URL),
+                                  str(tmp_path / "broken.log"), str(tmp_path / "working.log"))
+
+
+def test_known_failures_dont_stop_the_validation(tmp_path):
+    history = LinkHistory(None)
+    history.record(f"{BASE_URL}/old", True, 0.1)
+
+    summary = validate([f"{BASE_URL}/old", f"{BASE_URL}/ok"], history, 1, tmp_path)
+
+    assert not summary["stopped_early"]
+    assert summary["broken"] == 1
+    assert summary["new_broken"] == 0
+    assert summary["links"][f"{BASE_URL}/ok"]["status"] == 200
+
+
+def test_new_failure_stops_the_validation(tmp_path):
+    history = LinkHistory(None)
+    history.record(f"{BASE_URL}/old", True, 0.1)
+    history.record(f"{BASE_URL}/new", False, 0.1)
+
+    summary = validate([f"{BASE_URL}/old", f"{BASE_URL}/new", f"{BASE_URL}/ok"], history, 1, tmp_path)
+
+    assert summary["stopped_early"]
+    assert summary["new_broken"] == 1
+    assert history.failing(f"{BASE_URL}/new")
+
+
+def test_zero_max_broken_stops_at_the_first_new_failure(tmp_path):
+    summary = validate([f"{BASE_URL}/ok", f"{BASE_URL}/new"], LinkHistory(None), 0, tmp_path)
+
+    assert summary["stopped_early"]
+    assert summary["new_broken"] == 1
+
+
+def test_stopped_harvest_saves_the_page_cache(tmp_path):
+    checked = threading.Event()
+    checker = LinkChecker(BASE_URL, session=SignallingSession({}, checked), workers=1, redirect_cache=RedirectCache(None),
+                          page_cache=PageCache(str(tmp_path / "pages.json")), history=LinkHistory(None), max_broken=1)
+    browser = FakeBrowser()
+    pages = [f"{BASE_URL}/first", f"{BASE_URL}/second"]
+
+    summary = checker.harvest_and_validate([(pages, "LANDING")], browser, FakeHomePage(browser, checked), {}, {},
+                                           str(tmp_path / "broken.log"), str(tmp_path / "working.log"))
+
+    assert summary["stopped_early"]
+    with open(tmp_path / "pages.json", encoding="utf-8") as f:
+        assert set(json.load(f)) == set(pages)
@@ -0,0 +1,137 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from util.link_checker import LOOP_DETECTED, LinkChecker
+from util.link_history import LinkHistory
+from util.page_cache import PageCache
+from util.redirects import RedirectCache
+
+BASE_URL = "https://x.org"
+
+
+class FakeResponse:
+    def __init__(self, status_code, location=None):
+        self.status_code = status_code
+        self.headers = {"Location": location} if location else {}
+
+
+class FakeSession:
+    """Answers GET requests from a {url: (status, location)} map and records the requested URLs."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        status, location = self.routes.get(url, (404, None))
+        return FakeResponse(status, location)
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Replaces the browser session fixture, these tests only use a fake HTTP session."""
+    yield
+
+
+def make_checker(routes, cache_path):
+    return LinkChecker(BASE_URL, session=FakeSession(routes), redirect_cache=RedirectCache(str(cache_path)),
+                       page_cache=PageCache(None), history=LinkHistory(None))
+
+
+def chain_routes(length):
+    """Returns routes where /0 redirects to /1 ... and /<length> answers 200."""
+    routes = {f"{BASE_URL}/{i}": (301, f"/{i + 1}") for i in range(length)}
+    routes[f"{BASE_URL}/{length}"] = (200, None)
+    return routes
+
+
+def test_redirect_loop(tmp_path):
+    checker = make_checker({f"{BASE_URL}/a": (301, "/b"), f"{BASE_URL}/b": (302, "/a")}, tmp_path / "r.json")
+
+    resolution = checker.resolve(f"{BASE_URL}/a")
+
+    assert resolution["finding"] == "loop"
+    assert resolution["status"] == LOOP_DETECTED
+
+
+def test_too_many_redirects(tmp_path):
+    checker = make_checker(chain_routes(12), tmp_path / "r.json")
+
+    resolution = checker.resolve(f"{BASE_URL}/0")
+
+    assert resolution["finding"] == "too_many"
+    assert resolution["status"] == LOOP_DETECTED
+
+
+def test_long_redirect_chain(tmp_path):
+    checker = make_checker(chain_routes(4), tmp_path / "r.json")
+
+    resolution = checker.resolve(f"{BASE_URL}/0")
+
+    assert resolution["finding"] == "long_chain"
+    assert resolution["status"] == 200
+    assert resolution["final_url"] == f"{BASE_URL}/4"
+    assert resolution["hops"] == 4
+
+
+def test_cached_rerun_requests_first_hop_and_target(tmp_path):
+    routes = chain_routes(4)
+    first = make_checker(routes, tmp_path / "r.json")
+    first.resolve(f"{BASE_URL}/0")
+    first.redirect_cache.save()
+
+    second = make_checker(routes, tmp_path / "r.json")
+    resolution = second.resolve(f"{BASE_URL}/0")
+
+    assert second.session.calls == [f"{BASE_URL}/0", f"{BASE_URL}/4"]
+    assert resolution["status"] == 200
+    assert resolution["hops"] == 4
+    assert resolution["finding"] == "long_chain"
+
+
+def test_cached_rerun_reports_broken_first_hop(tmp_path):
+    routes = chain_routes(4)
+    first = make_checker(routes, tmp_path / "r.json")
+    first.resolve(f"{BASE_URL}/0")
+    first.redirect_cache.save()
+
+    routes[f"{BASE_URL}/0"] = (404, None)
+    second = make_checker(routes, tmp_path / "r.json")
+    resolution = second.resolve(f"{BASE_URL}/0")
+
+    assert second.session.calls == [f"{BASE_URL}/0"]
+    assert resolution["status"] == 404
+
+
+def test_cached_rerun_follows_changed_redirect(tmp_path):
+    routes = chain_routes(4)
+    first = make_checker(routes, tmp_path / "r.json")
+    first.resolve(f"{BASE_URL}/0")
+    first.redirect_cache.save()
+
+    routes[f"{BASE_URL}/0"] = (301, "/moved")
+    routes[f"{BASE_URL}/moved"] = (410, None)
+    second = make_checker(routes, tmp_path / "r.json")
+    resolution = second.resolve(f"{BASE_URL}/0")
+
+    assert second.session.calls == [f"{BASE_URL}/0", f"{BASE_URL}/moved"]
+    assert resolution["status"] == 410
+    assert resolution["final_url"] == f"{BASE_URL}/moved"
+
+
+def test_resolved_link_keeps_its_chain(tmp_path):
+    checker = make_checker(chain_routes(4), tmp_path / "r.json")
+    first = checker.resolve(f"{BASE_URL}/0")
+
+    again = checker.resolve(f"{BASE_URL}/0")
+    middle = checker.resolve(f"{BASE_URL}/2")
+
+    assert again["chain"] == first["chain"]
+    assert again["finding"] == "long_chain"
+    assert [hop["url"] for hop in middle["chain"]] == [f"{BASE_URL}/2", f"{BASE_URL}/3"]
+    assert middle["hops"] == 2
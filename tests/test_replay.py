@@ -0,0 +1,93 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from util.link_checker import LinkChecker
+from util.replay import Recording
+
+BASE_URL = "https://x.org"
+PAGE = f"{BASE_URL}/explore"
+PAGE_SOURCE = f"""
+<html><body>
+  <div class="card"><a href="/ok">Working link</a></div>
+  <li class="menu"><a href="/r2">Moved link</a></li>
+  <section class="footer"><a href="/gone">Gone link</a></section>
+  <h2 id="intro">Intro</h2>
+</body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, location=None):
+        self.status_code = status_code
+        self.headers = {"Location": location} if location else {}
+
+
+class FakeSession:
+    """Answers GET requests from a {url: (status, location)} map and records the requested URLs."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        status, location = self.routes.get(url, (404, None))
+        return FakeResponse(status, location)
+
+
+class FakeBrowser:
+    current_url = PAGE
+    page_source = PAGE_SOURCE
+
+    def get(self, url):
+        pass
+
+    def find_element(self, by, value):
+        return object()
+
+
+class FakeHomePage:
+    def wait_for_links(self):
+        return True
+
+    def get_page_fingerprint(self):
+        return None
+
+    def get_all_links(self, wait=True):
+        return [f"{BASE_URL}/ok", f"{BASE_URL}/r2", f"{BASE_URL}/gone", f"{PAGE}#intro", f"{PAGE}#missing"]
+
+    def get_anchor_targets(self):
+        return {"intro"}
+
+
+@pytest.fixture(autouse=True)
+def setup(monkeypatch):
+    """Replaces the browser session fixture and skips the page load pauses."""
+    monkeypatch.setattr("util.link_checker.time.sleep", lambda seconds: None)
+    yield
+
+
+def run(checker, tmp_path, browser=None, home_page=None):
+    all_links, link_sources = {}, {}
+    return checker.harvest_and_validate([([PAGE], "LANDING")], browser, home_page, all_links, link_sources,
+                                        str(tmp_path / "broken.log"), str(tmp_path / "working.log"))
+
+
+def test_replay_gives_the_recorded_results(tmp_path):
+    path = str(tmp_path / "recording.json")
+    routes = {f"{BASE_URL}/ok": (200, None), f"{BASE_URL}/r2": (302, "/ok"), PAGE: (200, None)}
+    recorded = run(LinkChecker(BASE_URL, session=FakeSession(routes), recording=Recording(path)), tmp_path,
+                   FakeBrowser(), FakeHomePage())
+
+    offline = FakeSession({})
+    replayed = run(LinkChecker(BASE_URL, session=offline, recording=Recording(path), replay=True), tmp_path)
+
+    assert offline.calls == []
+    assert replayed == recorded
+    assert replayed["links"][f"{BASE_URL}/r2"]["redirects"] == [{"url": f"{BASE_URL}/r2", "status": 302}]
+    assert "Gone link" in replayed["links"][f"{BASE_URL}/gone"]["context"]
+    assert replayed["links"][f"{PAGE}#missing"]["finding"] == "missing_anchor"
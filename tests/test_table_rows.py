@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import shutil
+import subprocess
+
+import pytest
+
+from pages.base_page import CustomBasePage
+
+BASE_URL = "https://x.org"
+
+# Runs each script sent on stdin against a mock ant-design table and answers with its result.
+# Every call is one step: a clicked page shows up load_steps steps later, with a spinner meanwhile.
+MOCK_TABLE = r"""
+const readline = require('readline');
+const config = JSON.parse(process.argv[1]);
+const table = {page: 0, loading: 0};
+const body = {
+    _scrollTop: 0,
+    clientHeight: config.view,
+    get scrollHeight() { return config.kind === 'virtual' ? config.page_size : config.view * 2; },
+    get scrollTop() { return this._scrollTop; },
+    set scrollTop(value) { this._scrollTop = Math.max(0, Math.min(value, this.scrollHeight - this.clientHeight)); },
+};
+const turnPage = () => { table.page += 1; body.scrollTop = 0; };
+const next = {
+    querySelector: () => null,
+    click: () => { table.loading = config.load_steps; if (!table.loading) { turnPage(); } },
+};
+const wrapper = {
+    querySelectorAll: () => {
+        let keys = Array.from({length: config.page_size}, (_, i) => `/row/${table.page}-${i}`);
+        if (config.kind === 'virtual') { keys = keys.slice(body.scrollTop, body.scrollTop + config.view + 5); }
+        return keys.map((key) => ({getAttribute: () => key}));
+    },
+    querySelector: (selector) => {
+        if (selector === '.ant-spin-spinning') { return table.loading ? {} : null; }
+        if (selector.startsWith('.ant-pagination-next')) { return table.page < config.pages - 1 ? next : null; }
+        if (selector.includes(config.kind === 'virtual' ? '.ant-table-tbody-virtual-holder' : '.ant-table-body')) {
+            return config.kind === 'none' ? null : body;
+        }
+        return null;
+    },
+};
+const document = {querySelectorAll: () => [wrapper]};
+const window = {};
+readline.createInterface({input: process.stdin}).on('line', (line) => {
+    const {script, args} = JSON.parse(line);
+    if (table.loading && --table.loading === 0) { turnPage(); }
+    const run = new Function('document', 'window', 'args', `return (function () {${script}\n}).apply(null, args);`);
+    process.stdout.write(JSON.stringify(run(document, window, args)) + '\n');
+});
+"""
+
+
+class NodeBrowser:
+    """Fake browser executing scripts in a node process that holds the mock table."""
+
+    def __init__(self, **config):
+        self.process = subprocess.Popen(["node", "-e", MOCK_TABLE, json.dumps(config)], text=True,
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        self.process.stdin.write(json.dumps({"script": script, "args": args}) + "\n")
+        self.process.stdin.flush()
+        return json.loads(self.process.stdout.readline())
+
+    def quit(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Replaces the browser session fixture, these tests only use a mock table."""
+    yield
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is needed to run the table script")
+@pytest.mark.parametrize("kind, page_size, view, load_steps", [
+    ("none", 10, 10, 0),
+    ("fixed", 10, 4, 0),
+    ("fixed", 10, 4, 2),
+    ("virtual", 25, 10, 0),
+    ("virtual", 25, 10, 2),
+])
+def test_harvest_table_rows_reads_every_page(kind, page_size, view, load_steps):
+    browser = NodeBrowser(kind=kind, pages=3, page_size=page_size, view=view, load_steps=load_steps)
+    page = CustomBasePage(browser, None, BASE_URL, logging.getLogger())
+    links = set()
+    try:
+        harvested = page.harvest_table_rows(links, pause=0)
+    finally:
+        browser.quit()
+
+    assert harvested == 3 * page_size
+    assert links == {f"{BASE_URL}/row/{p}-{i}" for p in range(3) for i in range(page_size)}
@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.landing_page import LandingPage
+from pages.login_page import LoginPage
+
+
+def create_browser(browser_name="chrome", headless=False):
+    """Starts the requested WebDriver and returns it with its default wait."""
+    if browser_name == "chrome":
+        options = ChromeOptions()
+        if headless:
+            options.add_argument("--headless")
+            options.add_argument("--ignore-certificate-errors")
+        browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+    elif browser_name == "firefox":
+        options = FirefoxOptions()
+        if headless:
+            options.add_argument("--headless")
+        browser = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    browser.set_page_load_timeout(60)
+    wait = WebDriverWait(browser, 20)
+    return browser, wait
+
+
+def login(browser, wait, config, logger):
+    """Logs in through the landing page 'Go to Lab' button and waits for the virtual lab."""
+    landing_page = LandingPage(browser, wait, config["base_url"], config["lab_url"], logger)
+    landing_page.go_to_landing_page()
+    landing_page.click_go_to_lab()
+
+    WebDriverWait(browser, 60).until(
+        EC.url_contains("openid-connect"),
+        message="Timed out waiting for OpenID login page"
+    )
+    login_page = LoginPage(browser, wait, config["lab_url"], logger)
+    login_page.perform_login(config["username"], config["password"])
+    login_page.wait_for_login_complete()
+    logger.info(f"✅ Logged in. Current URL: {browser.current_url}")
+
+
+def ensure_logged_in(browser, wait, config, logger):
+    """Opens the virtual lab and logs in again if the session has expired."""
+    browser.get(config["lab_url"])
+    WebDriverWait(browser, 30).until(
+        lambda d: "virtual-lab" in d.current_url or "openid-connect" in d.current_url,
+        message="Timed out waiting for the virtual lab or the login page"
+    )
+    if "openid-connect" in browser.current_url:
+        logger.warning("🚨 Session lost! Logging in again...")
+        login_page = LoginPage(browser, wait, config["lab_url"], logger)
+        login_page.perform_login(config["username"], config["password"])
+        login_page.wait_for_login_complete()
@@ -0,0 +1,164 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pages.home_page import HomePage
+from pages.urls import get_page_groups
+from util.browser import create_browser, ensure_logged_in, login
+from util.link_checker import LinkChecker
+
+
+class LinkCheckDaemon:
+    """
+    Keeps a logged-in browser and the HTTP session open and re-checks the site on a schedule.
+
+    Links are re-validated every cycle, pages are re-harvested (and their links validated as
+    they are found) every harvest_every cycles, and the latest results are served as JSON on a
+    local status endpoint.
+    """
+
+    def __init__(self, config, logger, browser_name="chrome", headless=True, interval=900, jitter=60,
+                 harvest_every=1, host="127.0.0.1", port=8765):
+        self.config = config
+        self.logger = logger
+        self.browser_name = browser_name
+        self.headless = headless
+        self.interval = interval
+        self.jitter = jitter
+        self.harvest_every = max(1, harvest_every)
+        self.host = host
+        self.port = port
+
+        self.browser = self.wait = self.home_page = None
+        self.checker = LinkChecker(config["base_url"])
+        self.all_links, self.link_sources = {}, {}
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.status = {
+            "env": config.get("env"),
+            "base_url": config["base_url"],
+            "started_at": None,
+            "cycles": 0,
+            "failed_cycles": 0,
+            "last_run": None,
+            "next_run": None,
+            "last_error": None,
+            "cycle_seconds": None,
+            "pages": 0,
+            "links": 0,
+            "valid": 0,
+            "broken": 0,
+        }
+        self.results = {}
+
+    def start(self):
+        """Opens the browser, logs in and runs check cycles until stopped."""
+        self.browser, self.wait = create_browser(self.browser_name, self.headless)
+        server = None
+        try:
+            self.home_page = HomePage(self.browser, self.wait, self.config["base_url"], self.logger)
+            login(self.browser, self.wait, self.config, self.logger)
+
+            server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.logger.info(f"📡 Status endpoint listening on http://{self.host}:{self.port}/status")
+            self._update(started_at=_now())
+
+            while not self.stop_event.is_set():
+                try:
+                    self.run_cycle()
+                except Exception as e:
+                    self.logger.error(f"❌ Check cycle failed: {e}")
+                    with self.lock:
+                        self.status["failed_cycles"] += 1
+                        self.status["last_error"] = str(e)
+
+                delay = max(0, self.interval + random.uniform(-self.jitter, self.jitter))
+                next_run = datetime.datetime.now() + datetime.timedelta(seconds=delay)
+                self._update(next_run=next_run.strftime("%Y-%m-%d %H:%M:%S"))
+                self.logger.info(f"💤 Next check in {delay:.0f} seconds.")
+                self.stop_event.wait(delay)
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            self.browser.quit()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run_cycle(self):
+        """Re-harvests the pages when due and re-validates every known link."""
+        cycle = self.status["cycles"]
+        started = time.monotonic()
+        if cycle % self.harvest_every == 0 or not self.all_links:
+            pages = self.home_page.get_pages(self.config["lab_id"], self.config["project_id"])
+            all_links, link_sources = {}, {}
+
+            ensure_logged_in(self.browser, self.wait, self.config, self.logger)
+            summary = self.checker.harvest_and_validate(get_page_groups(pages), self.browser, self.home_page,
+                                                        all_links, link_sources)
+            self.all_links, self.link_sources = all_links, link_sources
+            self._update(pages=len(pages))
+        else:
+            summary = self.checker.validate_links(self.all_links, self.link_sources)
+
+        with self.lock:
+            self.results = summary["links"]
+            self.status.update(
+                cycles=cycle + 1,
+                last_run=_now(),
+                last_error=None,
+                cycle_seconds=round(time.monotonic() - started, 2),
+                links=summary["total"],
+                valid=summary["valid"],
+                broken=summary["broken"],
+            )
+
+    def snapshot(self, path):
+        """Returns the JSON document served for the given endpoint path, or None if unknown."""
+        with self.lock:
+            if path == "/status":
+                return dict(self.status)
+            if path == "/results":
+                return dict(self.results)
+            if path == "/broken":
+                return {link: result for link, result in self.results.items() if result["status"] >= 400}
+        return None
+
+    def _update(self, **values):
+        with self.lock:
+            self.status.update(values)
+
+    def _make_handler(self):
+        daemon = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                document = daemon.snapshot(self.path.split("?")[0].rstrip("/") or "/status")
+                if document is None:
+                    self.send_error(404, "Use /status, /results or /broken")
+                    return
+                body = json.dumps(document, indent=2).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logging.debug(f"Status endpoint: {format % args}")
+
+        return StatusHandler
+
+
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,502 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import itertools
+import logging
+import math
+import queue
+import threading
+import time
+from contextlib import closing
+from urllib.parse import unquote, urldefrag, urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from util.link_history import LinkHistory
+from util.page_cache import PageCache
+from util.redirects import RedirectCache
+from util.replay import RecordingSession, ReplaySession
+
+SIGNIFICANT_TAGS = ["tr", "td", "div", "span", "li", "section", "article", "ul", "ol"]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# Redirect chains longer than this are reported, and walks stop after MAX_REDIRECTS hops.
+LONG_REDIRECT_CHAIN = 3
+MAX_REDIRECTS = 10
+LOOP_DETECTED = 508
+
+
+class _ValidationStopped(Exception):
+    """Raised to the producer once the broken link threshold is reached."""
+
+
+def get_page_contexts(soup, page_url):
+    """Returns the context of every anchor of a BeautifulSoup document, keyed by its absolute URL."""
+    contexts = {}
+    for element in soup.find_all("a", href=True):
+        contexts.setdefault(urljoin(page_url, element["href"]), _describe_parent(element))
+    return contexts
+
+
+def _link_contexts(page_source, page_url, page_links):
+    """Parses a page source and returns the context of each of page_links found in it."""
+    # Imported here so validating saved links doesn't need BeautifulSoup.
+    from bs4 import BeautifulSoup
+
+    page_contexts = get_page_contexts(BeautifulSoup(page_source, "html.parser"), page_url)
+    return {link: page_contexts[link] for link in page_links if link in page_contexts}
+
+
+def _describe_parent(element):
+    parent = element.find_parent(lambda tag: tag.has_attr("class") and any(cls.startswith("ant-table-row") for cls in tag["class"]))
+    if not parent:
+        for tag_name in SIGNIFICANT_TAGS:
+            parent = element.find_parent(tag_name)
+            if parent:
+                break
+
+    if parent:
+        return f"<{parent.name} class='{parent.get('class')}'> - {parent.get_text(strip=True)}"
+    return "[Unknown Element] - [No text]"
+
+
+def create_session(base_url, pool_size=10):
+    """Returns a requests session with the browser-like headers used for link validation."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    session.headers["Referer"] = base_url
+    return session
+
+
+class LinkChecker:
+    """
+    Harvests links from the site pages and validates their HTTP status.
+
+    Validation runs on a pool of worker threads fed through a bounded queue, so links can be
+    checked while the browser is still rendering the next page. Redirects are followed hop by
+    hop; every URL of a chain is remembered with its final result, so other links leading to
+    an already checked target don't trigger another request, and links whose first hop still
+    matches the redirect cache skip straight to the cached target. Fragment links (#section) to a
+    harvested page are checked against the ids collected on that page, without any request.
+    Pages whose link fingerprint matches the previous harvest reuse its cached links and
+    contexts instead of being parsed again. With a Recording, the HTTP responses and page
+    snapshots are recorded, or replayed offline when replay is set.
+
+    Queued links are checked in LinkHistory priority order (likely failures, same-origin and
+    fast links first), and with max_broken set the run stops once that many links are broken.
+    """
+
+    def __init__(self, base_url, session=None, workers=8, queue_size=256, redirect_cache=None, page_cache=None,
+                 recording=None, replay=False, history=None, max_broken=None):
+        self.base_url = base_url
+        self.workers = workers
+        self.queue_size = queue_size
+        self.session = session or create_session(base_url, pool_size=workers)
+        self.redirect_cache = redirect_cache if redirect_cache is not None else RedirectCache()
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self.history = history if history is not None else LinkHistory()
+        self.max_broken = max_broken
+        self.recording = recording
+        self.replay = replay
+        if recording is not None:
+            # The caches change which requests are made, so recorded and replayed runs go without them.
+            self.redirect_cache, self.page_cache, self.history = RedirectCache(None), PageCache(None), LinkHistory(None)
+            self.session = ReplaySession(recording) if replay else RecordingSession(self.session, recording)
+        self.resolved = {}
+        self.page_anchors = {}
+        self.lock = threading.Lock()
+
+    def iter_page_links(self, pages, context, browser, home_page):
+        """
+        Visits each page, records its fragment targets and yields it with its link contexts and absolute links.
+
+        Unchanged pages, detected by their fingerprint, are served from the page cache. When replaying,
+        the pages come from the recording and the browser isn't used, but the link contexts are
+        extracted again from the recorded page source.
+        """
+        # A fail-fast stop abandons this generator mid-harvest, so the caches are saved when it is closed.
+        try:
+            for page in pages:
+                logging.info(f"{context} Testing page: {page}")
+                if self.replay:
+                    snapshot = self.recording.pages.get(page)
+                    if snapshot is None:
+                        logging.warning(f"⚠️ No recorded snapshot for {page}, skipping it.")
+                        continue
+                    current_url, page_links = snapshot["current_url"], snapshot["links"]
+                    contexts = _link_contexts(snapshot["source"], current_url, page_links)
+                    anchors = None if snapshot["anchors"] is None else set(snapshot["anchors"])
+                else:
+                    current_url, page_source, page_links, contexts, anchors = self._visit_page(page, browser, home_page)
+                    if self.recording is not None:
+                        self.recording.record_page(page, current_url, page_source, page_links, anchors)
+
+                if anchors is not None:
+                    for url in (page, current_url):
+                        self.page_anchors[_page_key(url)] = anchors
+                yield page, contexts, page_links
+        finally:
+            self.page_cache.save()
+            if self.recording is not None and not self.replay:
+                self.recording.save()
+
+    def _visit_page(self, page, browser, home_page):
+        """
+        Loads the page in the browser and returns its final URL, source, links, link contexts and fragment targets.
+
+        The source is None when the page is served from the page cache.
+        """
+        # Imported here so validating saved links doesn't need the browser dependencies.
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        browser.get(page)
+        time.sleep(2)
+        WebDriverWait(browser, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+        # Fingerprint the page only once it is rendered like it is when its links are extracted.
+        fingerprint = home_page.get_page_fingerprint() if home_page.wait_for_links() else None
+        cached = self.page_cache.get(page, fingerprint)
+        if cached:
+            logging.info(f"♻️ Page unchanged, reusing {len(cached['links'])} cached links: {page}")
+            return browser.current_url, None, cached["links"], cached["contexts"], set(cached["anchors"])
+
+        page_source = browser.page_source
+        page_links = [urljoin(self.base_url, link) for link in home_page.get_all_links(wait=False)]
+        contexts = _link_contexts(page_source, browser.current_url, page_links)
+        anchors = home_page.get_anchor_targets()
+        if fingerprint and page_links and anchors is not None:
+            self.page_cache.set(page, fingerprint, page_links, contexts, anchors)
+        return browser.current_url, page_source, page_links, contexts, anchors
+
+    def collect_links_from_pages(self, pages, context, browser, home_page, all_links, link_sources):
+        for page, contexts, page_links in self.iter_page_links(pages, context, browser, home_page):
+            for full_link in page_links:
+                all_links[full_link] = contexts.get(full_link)
+                link_sources[full_link] = page
+
+    def harvest_and_validate(self, page_groups, browser, home_page, all_links, link_sources,
+                             broken_log_path="broken_links.log", working_log_path="working_links.log"):
+        """
+        Harvests the (pages, context) groups and validates each new link as soon as it is found.
+
+        The browser stays on the calling thread; links go through the bounded validation queue,
+        which blocks the harvest whenever the workers fall behind. Fragment links are queued once
+        every page is harvested, so they can point to pages visited later.
+
+        :return: The same summary dict as validate_links.
+        """
+        def produce(enqueue):
+            fragment_links = []
+            for pages, context in page_groups:
+                # Closed explicitly so the caches are saved right away when a fail-fast stop interrupts the harvest.
+                with closing(self.iter_page_links(pages, context, browser, home_page)) as harvest:
+                    for page, contexts, page_links in harvest:
+                        for full_link in page_links:
+                            if full_link in all_links:
+                                continue
+                            all_links[full_link] = contexts.get(full_link)
+                            link_sources[full_link] = page
+                            if urldefrag(full_link)[1]:
+                                fragment_links.append((full_link, all_links[full_link], page))
+                            else:
+                                enqueue(full_link, all_links[full_link], page)
+            for item in fragment_links:
+                enqueue(*item)
+
+        self.page_anchors = {}
+        summary = self._run_validation(produce, broken_log_path, working_log_path)
+        summary["total"] = len(all_links)
+        self.print_summary(summary["total"], summary["valid"], summary["broken"], summary["redirect_findings"],
+                           summary["stopped_early"], broken_log_path, working_log_path)
+        return summary
+
+    def validate_links(self, all_links, link_sources, broken_log_path="broken_links.log",
+                       working_log_path="working_links.log", quiet=False):
+        """
+        Checks every harvested link and writes the broken and working ones to their log files.
+
+        :param quiet: Don't print the summary, for callers that report the results themselves.
+        :return: A dict with the total/valid/broken counts and the per-link results.
+        """
+        def produce(enqueue):
+            with self.lock:
+                ordered = sorted(all_links, key=lambda link: self.history.priority(link, self.base_url))
+            for full_link in ordered:
+                enqueue(full_link, all_links[full_link], link_sources.get(full_link, "[Unknown Page]"))
+
+        summary = self._run_validation(produce, broken_log_path, working_log_path)
+        summary["total"] = len(all_links)
+        if not quiet:
+            self.print_summary(summary["total"], summary["valid"], summary["broken"], summary["redirect_findings"],
+                               summary["stopped_early"], broken_log_path, working_log_path)
+        return summary
+
+    def _run_validation(self, produce, broken_log_path, working_log_path):
+        """Runs produce(enqueue) on the calling thread while the workers validate the queued links."""
+        work = queue.PriorityQueue(maxsize=self.queue_size)
+        sequence = itertools.count()
+        stop = threading.Event()
+        lock = threading.Lock()
+        with self.lock:
+            self.resolved.clear()
+        results = {}
+        counts = {"valid": 0, "broken": 0, "new_broken": 0, "redirect_findings": 0}
+
+        with open(broken_log_path, "w", encoding="utf-8") as broken_log, \
+                open(working_log_path, "w", encoding="utf-8") as working_log:
+
+            def record(full_link, element_context, source_page):
+                if "@" in full_link:
+                    logging.info(f"Skipping links with '@': {full_link}")
+                    return
+
+                started = time.monotonic()
+                anchor_found = self.check_fragment(full_link)
+                if anchor_found is None:
+                    resolution = self.resolve(urldefrag(full_link)[0])
+                else:
+                    resolution = {
+                        "status": 200 if anchor_found else 404,
+                        "final_url": full_link,
+                        "chain": [],
+                        "finding": None if anchor_found else "missing_anchor",
+                    }
+                status_code = resolution["status"]
+                finding = resolution["finding"]
+                context_text = None
+                with self.lock:
+                    known_failure = self.history.failing(full_link)
+                    self.history.record(full_link, status_code >= 400, time.monotonic() - started)
+
+                with lock:
+                    if finding in ("loop", "too_many"):
+                        label = "🔁 Redirect loop" if finding == "loop" else "🔁 Too many redirects"
+                        log_file = broken_log
+                        counts["broken"] += 1
+                    elif finding == "missing_anchor":
+                        label = "⚓ Missing anchor"
+                        log_file = broken_log
+                        counts["broken"] += 1
+                    elif status_code == 403:
+                        label = "⚠️ Forbidden"
+                        log_file = broken_log
+                        counts["broken"] += 1
+                    elif status_code >= 400:
+                        label = "❌ Broken"
+                        log_file = broken_log
+                        counts["broken"] += 1
+                    else:
+                        label = "↪️ Long redirect chain" if finding == "long_chain" else "✅ Working"
+                        log_file = working_log
+                        counts["valid"] += 1
+
+                    if log_file is broken_log:
+                        context_text = element_context or "[Unknown Element] - [No text]"
+                        # Links that already failed last time aren't regressions and don't count toward max_broken.
+                        if not known_failure:
+                            counts["new_broken"] += 1
+                    if finding in ("loop", "too_many", "long_chain"):
+                        counts["redirect_findings"] += 1
+                    self.log_result(log_file, full_link, status_code, source_page, context_text, label,
+                                    resolution["chain"])
+
+                    results[full_link] = {
+                        "status": status_code,
+                        "page": source_page,
+                        "label": label,
+                        "final_url": resolution["final_url"],
+                        "redirects": resolution["chain"],
+                        "finding": finding,
+                        "context": context_text,
+                    }
+
+                    if (self.max_broken is not None and counts["new_broken"] >= max(self.max_broken, 1)
+                            and not stop.is_set()):
+                        logging.warning(f"🛑 {counts['new_broken']} new broken links found, stopping the validation.")
+                        stop.set()
+
+            def enqueue(full_link, element_context, source_page):
+                if stop.is_set():
+                    raise _ValidationStopped()
+                with self.lock:
+                    priority = self.history.priority(full_link, self.base_url)
+                work.put((priority, next(sequence), full_link, element_context, source_page))
+
+            def worker():
+                while True:
+                    item = work.get()
+                    if item[2] is None:
+                        return
+                    if stop.is_set():
+                        continue
+                    try:
+                        record(*item[2:])
+                    except Exception as e:
+                        logging.error(f"❌ Validation failed for {item[2]}: {e}")
+
+            threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.workers)]
+            for thread in threads:
+                thread.start()
+            try:
+                produce(enqueue)
+            except _ValidationStopped:
+                pass
+            finally:
+                for _ in threads:
+                    work.put(((math.inf,), next(sequence), None, None, None))
+                for thread in threads:
+                    thread.join()
+                with self.lock:
+                    self.redirect_cache.save()
+                    self.history.save()
+                if self.recording is not None and not self.replay:
+                    self.recording.save()
+
+        return {"total": len(results), "valid": counts["valid"], "broken": counts["broken"],
+                "new_broken": counts["new_broken"], "redirect_findings": counts["redirect_findings"],
+                "stopped_early": stop.is_set(), "links": results}
+
+    def check_fragment(self, url):
+        """
+        Checks the fragment of url against the targets collected on its harvested page.
+
+        :return: True or False, or None when there is nothing to check (no fragment, the implicit
+                 #top, a hash route such as #/path, or a page that wasn't harvested).
+        """
+        page, fragment = urldefrag(url)
+        fragment = unquote(fragment)
+        if not fragment or fragment == "top" or fragment[0] in "/!":
+            return None
+        anchors = self.page_anchors.get(_page_key(page))
+        if anchors is None:
+            return None
+        return fragment in anchors
+
+    def resolve(self, url):
+        """
+        Follows the redirects of url one hop at a time and returns where it ends up.
+
+        Every walk requests the link itself. When a hop still redirects to the next hop recorded in
+        the redirect cache, the rest of the chain is skipped and only the cached final target is
+        checked; the cached hop count keeps long chains reported. A hop already resolved in this run
+        ends the walk with that result, and its remaining hops are added to the chain. Loops and chains longer than MAX_REDIRECTS end with status
+        508 (Loop Detected).
+
+        :return: A dict with the final status and URL, the list of redirect hops, the total number of
+                 redirects, and a finding ("loop", "too_many" or "long_chain") when the chain is suspicious.
+        """
+        chain, seen, requested = [], {url}, []
+        current, status, finding, hops = url, None, None, 0
+
+        while status is None:
+            with self.lock:
+                known = self.resolved.get(current)
+            if known is not None:
+                status, current = known["status"], known["final_url"]
+                chain.extend(known["chain"])
+                hops += known["hops"]
+                break
+
+            try:
+                response = self.session.get(current, allow_redirects=False, timeout=5)
+            except requests.RequestException as e:
+                logging.error(f"❌ Request failed for {current}: {str(e)}")
+                status = 500
+                break
+            location = response.headers.get("Location")
+            if not (300 <= response.status_code < 400 and location):
+                status = response.status_code
+                break
+
+            next_url = urljoin(current, location)
+            requested.append((current, next_url, hops, len(chain)))
+            chain.append({"url": current, "status": response.status_code})
+            hops += 1
+
+            with self.lock:
+                cached = self.redirect_cache.get(current)
+            if cached and cached["next"] == next_url and cached["hops"] > 1 and cached["target"] not in seen:
+                chain.append({"url": next_url, "status": "cached"})
+                seen.add(next_url)
+                hops += cached["hops"] - 1
+                next_url = cached["target"]
+
+            if next_url in seen:
+                finding, status = "loop", LOOP_DETECTED
+            elif hops >= MAX_REDIRECTS:
+                finding, status = "too_many", LOOP_DETECTED
+            seen.add(next_url)
+            current = next_url
+
+        if finding:
+            logging.warning(f"🔁 Redirect {finding} for {url}: {' → '.join(hop['url'] for hop in chain)}")
+        elif hops > LONG_REDIRECT_CHAIN:
+            finding = "long_chain"
+
+        with self.lock:
+            if finding not in ("loop", "too_many"):
+                self.resolved[current] = {"status": status, "final_url": current, "hops": 0, "chain": []}
+                for hop_url, next_url, hops_before, position in requested:
+                    self.resolved[hop_url] = {"status": status, "final_url": current, "hops": hops - hops_before,
+                                              "chain": chain[position:]}
+                    self.redirect_cache.set(hop_url, next_url, current, hops - hops_before)
+
+        return {"status": status, "final_url": current, "chain": chain, "hops": hops, "finding": finding}
+
+    def format_result(self, link, status, page, context=None, redirects=None):
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        message = f"{timestamp} | {link} → Status {status} | Page: {page}"
+        if redirects:
+            hops = " → ".join(f"{hop['url']} ({hop['status']})" for hop in redirects)
+            message += f" | Redirects: {hops}"
+        if context:
+            message += f" | Found in: {context}"
+        return message
+
+    def log_result(self, log_file, link, status, page, context=None, label="", redirects=None):
+        message = self.format_result(link, status, page, context, redirects)
+        print(f"{label} {message}")
+        logging.info(message)
+        log_file.write(message + "\n")
+
+    def write_logs(self, results, broken_log_path, working_log_path):
+        """Writes already validated results to the broken and working link logs."""
+        with open(broken_log_path, "w", encoding="utf-8") as broken_log, \
+                open(working_log_path, "w", encoding="utf-8") as working_log:
+            for link, result in results.items():
+                log_file = broken_log if result["status"] >= 400 else working_log
+                message = self.format_result(link, result["status"], result["page"], result.get("context"),
+                                             result.get("redirects"))
+                log_file.write(message + "\n")
+
+    def print_summary(self, total, valid, broken, redirect_findings=0, stopped_early=False,
+                      broken_log_path="broken_links.log", working_log_path="working_links.log"):
+        print("\n📊 Test Summary:")
+        print(f"🔗 Total links: {total}")
+        print(f"✅ Valid: {valid}")
+        print(f"❌ Broken: {broken}")
+        print(f"🔁 Redirect findings: {redirect_findings}")
+        if stopped_early:
+            print("🛑 Stopped early at the broken link threshold, the other links weren't checked.")
+        logging.info(f"✅ Test completed. Check {broken_log_path} and {working_log_path} for details.")
+
+
+def _page_key(url):
+    """Normalizes a page URL so links to it match regardless of fragment or trailing slash."""
+    return urldefrag(url)[0].rstrip("/")
@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import json
+
+
+def save_harvest(path, base_url, all_links, link_sources, page_anchors):
+    """Writes the harvested links, their source pages and element contexts, and the pages' anchors to a JSON file."""
+    harvest = {
+        "base_url": base_url,
+        "harvested_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "links": link_sources,
+        "contexts": all_links,
+        "anchors": {page: sorted(anchors) for page, anchors in page_anchors.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(harvest, f, indent=2)
+
+
+def load_links(path):
+    """
+    Reads the links to validate from a harvest JSON file or a plain list with one URL per line.
+
+    Blank lines and lines starting with '#' are ignored in plain lists.
+
+    :return: A (base_url, all_links, link_sources, page_anchors) tuple; all_links maps each link to its
+             element context, which is None for plain lists, as is base_url.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    if content.lstrip().startswith("{"):
+        harvest = json.loads(content)
+        anchors = {page: set(targets) for page, targets in harvest.get("anchors", {}).items()}
+        contexts = harvest.get("contexts", {})
+        all_links = {link: contexts.get(link) for link in harvest["links"]}
+        return harvest.get("base_url"), all_links, harvest["links"], anchors
+
+    link_sources = {}
+    for line in content.splitlines():
+        url = line.strip()
+        if url and not url.startswith("#"):
+            link_sources[url] = path
+    return None, dict.fromkeys(link_sources), link_sources, {}
+
+
+def save_results(path, summary):
+    """Writes a validation summary to a JSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import os
+from urllib.parse import urlparse
+
+# Response time assumed for links that were never checked.
+DEFAULT_LATENCY = 1.0
+
+
+class LinkHistory:
+    """
+    Keeps how often each link failed and how long it took to check, to schedule likely failures first.
+    """
+
+    def __init__(self, path=".cache/link_history.json"):
+        self.path = path
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Ignoring unreadable link history {self.path}: {e}")
+            self.entries = {}
+
+    def priority(self, url, base_url):
+        """
+        Returns the sort key of url: highest failure rate first, then same-origin before external
+        links, then the fastest links first.
+
+        The failure rate is smoothed so that unknown links rank between flaky and stable ones.
+        """
+        entry = self.entries.get(url, {})
+        checks = entry.get("checks", 0)
+        failure_rate = (entry.get("failures", 0) + 1) / (checks + 2)
+        external = urlparse(url).netloc != urlparse(base_url).netloc
+        return -round(failure_rate, 1), int(external), entry.get("latency", DEFAULT_LATENCY)
+
+    def failing(self, url):
+        """Returns True if url failed the last time it was checked."""
+        return self.entries.get(url, {}).get("last_failed", False)
+
+    def record(self, url, failed, seconds):
+        entry = self.entries.setdefault(url, {"checks": 0, "failures": 0, "latency": seconds})
+        entry["checks"] += 1
+        entry["failures"] += int(failed)
+        entry["last_failed"] = bool(failed)
+        entry["latency"] = round((entry["latency"] + seconds) / 2, 3)
+
+    def save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
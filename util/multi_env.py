@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from urllib.parse import urlparse
+
+from pages.home_page import HomePage
+from pages.urls import get_page_groups
+from util.browser import create_browser, login
+from util.link_checker import LinkChecker
+from util.link_files import save_results
+from util.link_history import LinkHistory
+from util.page_cache import PageCache
+from util.redirects import RedirectCache
+from util.util_base import get_env_config
+
+EXTERNAL = "external"
+
+
+def check_environments(envs, logger, browser_name="chrome", headless=True, workers=8):
+    """
+    Harvests several environments in one browser and checks every distinct link only once.
+
+    Links on an environment's own host are validated by that environment's checker, everything
+    else (brain-map.org, GitHub, journals...) is pooled and validated once by a shared checker.
+    The results are then split back into broken_links_<env>.log, working_links_<env>.log and
+    results_<env>.json for each environment.
+
+    :return: A dict mapping each environment to its summary.
+    """
+    configs = {env: get_env_config(env) for env in envs}
+    # One instance of each cache for every checker, otherwise each checker's save overwrites the others' entries.
+    caches = {"redirect_cache": RedirectCache(), "page_cache": PageCache(), "history": LinkHistory()}
+    checkers = {env: LinkChecker(config["base_url"], workers=workers, **caches) for env, config in configs.items()}
+    harvests = {}
+
+    browser, wait = create_browser(browser_name, headless)
+    try:
+        for env, config in configs.items():
+            logger.info(f"🌍 Harvesting {env.upper()}: {config['base_url']}")
+            login(browser, wait, config, logger)
+            home_page = HomePage(browser, wait, config["base_url"], logger)
+            all_links, link_sources = {}, {}
+            pages = home_page.get_pages(config["lab_id"], config["project_id"])
+            for group, label in get_page_groups(pages):
+                checkers[env].collect_links_from_pages(group, label, browser, home_page, all_links, link_sources)
+            harvests[env] = (all_links, link_sources)
+    finally:
+        browser.quit()
+
+    owners = {urlparse(config["base_url"]).netloc: env for env, config in configs.items()}
+    groups = {}
+    for env, (all_links, link_sources) in harvests.items():
+        for link, element_context in all_links.items():
+            owner = owners.get(urlparse(link).netloc, EXTERNAL)
+            links, sources = groups.setdefault(owner, ({}, {}))
+            links.setdefault(link, element_context)
+            sources.setdefault(link, link_sources[link])
+
+    external_checker = LinkChecker(configs[envs[0]]["base_url"], workers=workers, **caches)
+    results = {}
+    for owner, (links, sources) in groups.items():
+        logger.info(f"🔎 Validating {len(links)} {owner} links")
+        checker = external_checker if owner == EXTERNAL else checkers[owner]
+        summary = checker.validate_links(links, sources, os.devnull, os.devnull, quiet=True)
+        results.update(summary["links"])
+
+    summaries = {}
+    for env, (all_links, link_sources) in harvests.items():
+        env_results = {
+            link: dict(results[link], page=link_sources[link]) for link in all_links if link in results
+        }
+        broken = sum(1 for result in env_results.values() if result["status"] >= 400)
+        summaries[env] = {
+            "total": len(all_links),
+            "valid": len(env_results) - broken,
+            "broken": broken,
+            "redirect_findings": sum(
+                1 for result in env_results.values() if result["finding"] in ("loop", "too_many", "long_chain")
+            ),
+            "links": env_results,
+        }
+        broken_log_path, working_log_path = f"broken_links_{env}.log", f"working_links_{env}.log"
+        checkers[env].write_logs(env_results, broken_log_path, working_log_path)
+        save_results(f"results_{env}.json", summaries[env])
+        print(f"\n🌍 {env.upper()}")
+        checkers[env].print_summary(summaries[env]["total"], summaries[env]["valid"], broken,
+                                    summaries[env]["redirect_findings"], broken_log_path=broken_log_path,
+                                    working_log_path=working_log_path)
+
+    return summaries
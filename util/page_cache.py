@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import os
+
+
+class PageCache:
+    """
+    Keeps the links, link contexts and fragment targets of each harvested page with its fingerprint.
+
+    A page whose fingerprint is unchanged on the next harvest can reuse these instead of being parsed again.
+    """
+
+    def __init__(self, path=".cache/pages.json"):
+        self.path = path
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Ignoring unreadable page cache {self.path}: {e}")
+            self.entries = {}
+
+    def get(self, page, fingerprint):
+        """Returns the cached entry of page if it was stored with the same fingerprint, None otherwise."""
+        entry = self.entries.get(page)
+        if not fingerprint or not entry or entry["fingerprint"] != fingerprint:
+            return None
+        return entry
+
+    def set(self, page, fingerprint, links, contexts, anchors):
+        self.entries[page] = {
+            "fingerprint": fingerprint,
+            "links": list(links),
+            "contexts": contexts,
+            "anchors": sorted(anchors),
+        }
+
+    def save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
@@ -0,0 +1,52 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import os
+import time
+
+
+class RedirectCache:
+    """
+    Remembers the next hop, final target and hop count of redirecting URLs.
+
+    A later run still requests the URL itself, and only skips to the final target when the URL
+    redirects to the same next hop. Entries older than max_age seconds are ignored.
+    """
+
+    def __init__(self, path=".cache/redirects.json", max_age=7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Ignoring unreadable redirect cache {self.path}: {e}")
+            self.entries = {}
+
+    def get(self, url):
+        """Returns the cached {"next", "target", "hops"} entry of url, or None if unknown or expired."""
+        entry = self.entries.get(url)
+        if not entry or "next" not in entry or time.time() - entry["checked_at"] > self.max_age:
+            return None
+        return entry
+
+    def set(self, url, next_url, target, hops):
+        self.entries[url] = {"next": next_url, "target": target, "hops": hops, "checked_at": time.time()}
+
+    def save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
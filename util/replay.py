@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Blue Brain Project/EPFL
+# Copyright (c) 2025 Open Brain Institute
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import os
+import threading
+
+import requests
+
+
+class Recording:
+    """
+    HTTP responses and harvested page snapshots of a run, saved to a JSON file.
+
+    A run made with a RecordingSession (and a LinkChecker recording its pages) can be replayed
+    offline with a ReplaySession, giving the same results without a browser or network access.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.http = {}
+        self.pages = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            recording = json.load(f)
+        self.http = recording.get("http", {})
+        self.pages = recording.get("pages", {})
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Validation workers may still be recording, so write a copy taken under the lock.
+        with self.lock:
+            recording = {"http": dict(self.http), "pages": dict(self.pages)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(recording, f, indent=2)
+        logging.info(f"💾 Saved {len(self.http)} responses and {len(self.pages)} pages to {self.path}")
+
+    def record_response(self, url, status_code=None, location=None, error=None):
+        with self.lock:
+            self.http[url] = {"status": status_code, "location": location, "error": error}
+
+    def record_page(self, page, current_url, page_source, links, anchors):
+        """Records the raw source, links and fragment targets of a page; link contexts are extracted again on replay."""
+        with self.lock:
+            self.pages[page] = {
+                "current_url": current_url,
+                "source": page_source,
+                "links": list(links),
+                "anchors": None if anchors is None else sorted(anchors),
+            }
+
+
+class RecordingSession:
+    """Wraps a requests session and records the status and redirect target of every GET."""
+
+    def __init__(self, session, recording):
+        self.session = session
+        self.recording = recording
+        self.headers = session.headers
+
+    def get(self, url, **kwargs):
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.RequestException as e:
+            self.recording.record_response(url, error=str(e))
+            raise
+        self.recording.record_response(url, response.status_code, response.headers.get("Location"))
+        return response
+
+
+class ReplayResponse:
+    def __init__(self, url, status_code, location=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = {"Location": location} if location else {}
+
+
+class ReplaySession:
+    """Answers GET requests from a recording; URLs that weren't recorded fail like a network error."""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.headers = {}
+
+    def get(self, url, **kwargs):
+        entry = self.recording.http.get(url)
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded response for {url}")
+        if entry["error"]:
+            raise requests.RequestException(entry["error"])
+        return ReplayResponse(url, entry["status"], entry["location"])
@@ -41,5 +41,49 @@ def load_config():
         raise
 
 
+ENVIRONMENTS = {
+    "staging": {
+        "base_url": "https://staging.openbraininstitute.org",
+        "username_var": "OBI_USERNAME_STAGING",
+        "password_var": "OBI_PASSWORD_STAGING",
+        "lab_id_var": "LAB_ID_STAGING",
+        "project_id_var": "PROJECT_ID_STAGING",
+    },
+    "production": {
+        "base_url": "https://www.openbraininstitute.org",
+        "username_var": "OBI_USERNAME_PRODUCTION",
+        "password_var": "OBI_PASSWORD_PRODUCTION",
+        "lab_id_var": "LAB_ID_PRODUCTION",
+        "project_id_var": "PROJECT_ID_PRODUCTION",
+    },
+}
 
 
+def get_env_config(env):
+    """
+    Gets credentials and IDs from the environment variables and returns the settings of the given environment.
+
+    The credentials are read from the environment's own variables (e.g. OBI_USERNAME_STAGING) and fall
+    back to OBI_USERNAME / OBI_PASSWORD, so one run can log in to environments with different accounts.
+    """
+    if env not in ENVIRONMENTS:
+        raise ValueError(f"Invalid environment: {env}")
+
+    settings = ENVIRONMENTS[env]
+    username = os.getenv(settings["username_var"]) or os.getenv("OBI_USERNAME")
+    password = os.getenv(settings["password_var"]) or os.getenv("OBI_PASSWORD")
+
+    if not username or not password:
+        raise ValueError(f"Username or password is missing in the configuration! Set {settings['username_var']} "
+                         f"and {settings['password_var']}, or OBI_USERNAME and OBI_PASSWORD.")
+
+    base_url = settings["base_url"]
+    return {
+        "env": env,
+        "username": username,
+        "password": password,
+        "base_url": base_url,
+        "lab_url": f"{base_url}/app/virtual-lab",
+        "lab_id": os.getenv(settings["lab_id_var"]),
+        "project_id": os.getenv(settings["project_id_var"]),
+    }